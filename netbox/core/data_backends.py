@@ -33,6 +33,8 @@ def register_backend(name):
 
 class DataBackend:
     parameters = {}
+    # Indicates whether the local copy of the data persists between syncs (i.e. file modification times are stable)
+    persistent = False
 
     def __init__(self, url, **kwargs):
         self.url = url
@@ -49,6 +51,7 @@ class DataBackend:
 
 @register_backend(DataSourceTypeChoices.LOCAL)
 class LocalBackend(DataBackend):
+    persistent = True
 
     @contextmanager
     def fetch(self):
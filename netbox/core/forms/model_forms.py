@@ -67,10 +67,8 @@ class DataSourceForm(NetBoxModelForm):
 
     def save(self, *args, **kwargs):
 
-        parameters = {}
-        for name in self.fields:
-            if name.startswith('backend_'):
-                parameters[name[8:]] = self.cleaned_data[name]
-        self.instance.parameters = parameters
+        self.instance.parameters = {
+            name[8:]: self.cleaned_data[name] for name in self.backend_fields
+        }
 
         return super().save(*args, **kwargs)
@@ -20,7 +20,7 @@ def sync_datasource(job_result, *args, **kwargs):
         datasource.sync()
 
         # Update the search cache for DataFiles belonging to this source
-        search_backend.cache(datasource.datafiles.iterator())
+        search_backend.cache(datasource.datafiles.defer('data').iterator())
 
     except SyncError as e:
         job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
@@ -1,14 +1,17 @@
+import fnmatch
+import hashlib
 import logging
 import os
+import re
 import yaml
-from fnmatch import fnmatchcase
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.module_loading import import_string
@@ -18,7 +21,6 @@ from extras.models import JobResult
 from netbox.models import PrimaryModel
 from netbox.models.features import ChangeLoggingMixin
 from netbox.registry import registry
-from utilities.files import sha256_hash
 from utilities.querysets import RestrictedQuerySet
 from ..choices import *
 from ..exceptions import SyncError
@@ -31,6 +33,12 @@ __all__ = (
 
 logger = logging.getLogger('netbox.core.data')
 
+# Validates a hex-encoded SHA256 digest
+HashValidator = RegexValidator(
+    regex='^[0-9a-f]{64}$',
+    message=_("Length must be 64 hexadecimal characters.")
+)
+
 
 class DataSource(PrimaryModel):
     """
@@ -151,43 +159,88 @@ class DataSource(PrimaryModel):
         with backend.fetch() as local_path:
 
             logger.debug(f'Syncing files from source root {local_path}')
-            data_files = self.datafiles.all()
-            known_paths = {df.path for df in data_files}
-            logger.debug(f'Starting with {len(known_paths)} known files')
-
-            # Check for any updated/deleted files
+            # Retrieve only the attributes needed to detect changes to known files
+            known_files = {
+                row['path']: row for row in self.datafiles.values('pk', 'path', 'size', 'hash', 'mtime')
+            }
+            logger.debug(f'Starting with {len(known_files)} known files')
+
+            def refresh_known_file(row):
+                """
+                Return a refreshed DataFile for a known file if its contents or modification time have changed;
+                otherwise return None.
+                """
+                datafile = DataFile(source=self, **row)
+                if datafile.refresh_from_disk(source_root=local_path) or datafile.mtime != row['mtime']:
+                    return datafile
+
+            # Check for any updated/deleted files. Files are refreshed concurrently, as file I/O and hashing both
+            # release the GIL.
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    row['pk']: executor.submit(refresh_known_file, row)
+                    for row in known_files.values()
+                }
             updated_files = []
+            touched_files = []
             deleted_file_ids = []
-            for datafile in data_files:
-
+            for pk, future in futures.items():
                 try:
-                    if datafile.refresh_from_disk(source_root=local_path):
-                        updated_files.append(datafile)
+                    if datafile := future.result():
+                        if datafile.hash != known_files[datafile.path]['hash']:
+                            updated_files.append(datafile)
+                        elif backend.persistent:
+                            # Only the file's modification time has changed. This is recorded only if the local copy
+                            # persists between syncs; otherwise every file would be rewritten on every sync.
+                            touched_files.append(datafile)
                 except FileNotFoundError:
                     # File no longer exists
-                    deleted_file_ids.append(datafile.pk)
+                    deleted_file_ids.append(pk)
                     continue
 
-            # Bulk update modified files
-            updated_count = DataFile.objects.bulk_update(updated_files, ('last_updated', 'size', 'hash', 'data'))
-            logger.debug(f"Updated {updated_count} files")
-
-            # Bulk delete deleted files
-            deleted_count, _ = DataFile.objects.filter(pk__in=deleted_file_ids).delete()
-            logger.debug(f"Deleted {updated_count} files")
-
             # Walk the local replication to find new files
-            new_paths = self._walk(local_path) - known_paths
-
-            # Bulk create new files
-            new_datafiles = []
-            for path in new_paths:
-                datafile = DataFile(source=self, path=path)
-                datafile.refresh_from_disk(source_root=local_path)
-                datafile.full_clean()
-                new_datafiles.append(datafile)
-            created_count = len(DataFile.objects.bulk_create(new_datafiles, batch_size=100))
-            logger.debug(f"Created {created_count} data files")
+            new_paths = self._walk(local_path).difference(known_files)
+
+            # Prepare new files
+            new_datafiles = [DataFile(source=self, path=path) for path in new_paths]
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                list(executor.map(lambda datafile: datafile.refresh_from_disk(source_root=local_path), new_datafiles))
+
+            # Validate new files. full_clean() is avoided here as it would query the database for each file;
+            # uniqueness is already ensured, as only previously unknown paths are included.
+            max_path_length = DataFile._meta.get_field('path').max_length
+            for datafile in new_datafiles:
+                if len(datafile.path) > max_path_length:
+                    raise ValidationError({
+                        'path': f"File path exceeds the maximum length of {max_path_length} characters: {datafile.path}"
+                    })
+                if not HashValidator.regex.search(datafile.hash):
+                    raise ValidationError({
+                        'hash': f"Invalid SHA256 hash for file {datafile.path}: {datafile.hash}"
+                    })
+
+            with transaction.atomic():
+
+                # Bulk update modified files
+                updated_count = DataFile.objects.bulk_update(
+                    updated_files,
+                    ('last_updated', 'size', 'hash', 'data', 'mtime'),
+                    batch_size=1000
+                )
+                logger.debug(f"Updated {updated_count} files")
+
+                # Record the modification times of unchanged files, so that they are not read again on the next sync
+                DataFile.objects.bulk_update(touched_files, ('mtime',), batch_size=1000)
+
+                # Bulk delete deleted files. A raw delete cannot be used, as objects referencing a DataFile must be
+                # updated and its search cache entries removed.
+                if deleted_file_ids:
+                    deleted_count, _ = DataFile.objects.filter(pk__in=deleted_file_ids).delete()
+                    logger.debug(f"Deleted {deleted_count} files")
+
+                # Bulk create new files
+                created_count = len(DataFile.objects.bulk_create(new_datafiles, batch_size=1000))
+                logger.debug(f"Created {created_count} data files")
 
         # Update status & last_synced time
         self.status = DataSourceStatusChoices.COMPLETED
@@ -202,30 +255,44 @@ class DataSource(PrimaryModel):
         Return a set of all non-excluded files within the root path.
         """
         logger.debug(f"Walking {root}...")
+        ignore_match = self._get_ignore_regex().match  # Compiled once per walk
+        root_length = len(os.path.join(root, ''))  # Length of the root path including a trailing separator
         paths = set()
 
-        for path, dir_names, file_names in os.walk(root):
-            path = path.split(root)[1].lstrip('/')  # Strip root path
-            if path.startswith('.'):
-                continue
-            for file_name in file_names:
-                if not self._ignore(file_name):
-                    paths.add(os.path.join(path, file_name))
+        def _scan(path):
+            try:
+                entries = os.scandir(path)
+            except OSError:
+                # Ignore unreadable directories (consistent with os.walk())
+                return
+            with entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Skip hidden directories, and don't follow symlinks to directories
+                        if not entry.name.startswith('.') and not entry.is_symlink():
+                            _scan(entry.path)
+                    elif not ignore_match(entry.name):
+                        paths.add(entry.path[root_length:])  # Strip root path
+
+        _scan(root)
 
         logger.debug(f"Found {len(paths)} files")
         return paths
 
+    def _get_ignore_regex(self):
+        """
+        Compile the DataSource's unique ignore rules into a single regular expression, which also matches any hidden
+        (dot-prefixed) file name.
+        """
+        rules = dict.fromkeys(rule for rule in self.ignore_rules.splitlines() if rule)
+        return re.compile(r'\.' + ''.join(f'|(?:{fnmatch.translate(rule)})' for rule in rules))
+
     def _ignore(self, filename):
         """
         Returns a boolean indicating whether the file should be ignored per the DataSource's configured
         ignore rules.
         """
-        if filename.startswith('.'):
-            return True
-        for rule in self.ignore_rules.splitlines():
-            if fnmatchcase(filename, rule):
-                return True
-        return False
+        return self._get_ignore_regex().match(filename) is not None
 
 
 class DataFile(models.Model):
@@ -256,12 +323,16 @@ class DataFile(models.Model):
     hash = models.CharField(
         max_length=64,
         editable=False,
-        validators=[
-            RegexValidator(regex='^[0-9a-f]{64}$', message=_("Length must be 64 hexadecimal characters."))
-        ],
+        validators=[HashValidator],
         help_text=_("SHA256 hash of the file data")
     )
     data = models.BinaryField()
+    mtime = models.FloatField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text=_("Modification time of the file on disk when its data was last read")
+    )
 
     objects = RestrictedQuerySet.as_manager()
 
@@ -286,7 +357,8 @@ class DataFile(models.Model):
     @property
     def data_as_string(self):
         try:
-            return self.data.tobytes().decode('utf-8')
+            # Decode the buffer directly, without first copying it to a bytes object
+            return str(self.data, 'utf-8')
         except UnicodeDecodeError:
             return None
 
@@ -294,23 +366,38 @@ class DataFile(models.Model):
         """
         Attempt to read the file data as JSON/YAML and return a native Python object.
         """
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
         # TODO: Something more robust
-        return yaml.safe_load(self.data_as_string)
+        # PyYAML decodes bytes itself, so avoid first decoding the data to a string
+        return yaml.load(bytes(self.data), Loader=SafeLoader)
 
     def refresh_from_disk(self, source_root):
         """
-        Update instance attributes from the file on disk. Returns True if any attribute
-        has changed.
+        Update instance attributes from the file on disk. Returns True if the file's contents
+        have changed. The file's modification time is recorded even if its contents are unchanged.
         """
         file_path = os.path.join(source_root, self.path)
-        file_hash = sha256_hash(file_path).hexdigest()
+
+        # Skip reading & hashing the file if its size and modification time are unchanged
+        stat = os.stat(file_path)
+        if self.mtime is not None and stat.st_mtime == self.mtime and stat.st_size == self.size:
+            return False
+
+        # Read the file only once, hashing the same buffer which will be stored as the file's data
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        file_hash = hashlib.sha256(data).hexdigest()
 
         # Update instance file attributes & data
         if is_modified := file_hash != self.hash:
             self.last_updated = timezone.now()
-            self.size = os.path.getsize(file_path)
+            self.size = len(data)
             self.hash = file_hash
-            with open(file_path, 'rb') as f:
-                self.data = f.read()
+            self.data = data
+        self.mtime = stat.st_mtime
 
         return is_modified
@@ -0,0 +1,134 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.choices import DataSourceTypeChoices
+from core.data_backends import LocalBackend
+from core.models import DataSource
+
+
+class DataSourceTest(TestCase):
+
+    def test_ignore(self):
+        datasource = DataSource(ignore_rules='*.txt\nfoo?.yaml')
+
+        self.assertTrue(datasource._ignore('.hidden'))
+        self.assertTrue(datasource._ignore('file.txt'))
+        self.assertTrue(datasource._ignore('foo1.yaml'))
+        self.assertFalse(datasource._ignore('foo10.yaml'))
+        self.assertFalse(datasource._ignore('file.json'))
+        self.assertFalse(DataSource()._ignore('file.txt'))
+
+        # Changes to the ignore rules take effect immediately
+        datasource.ignore_rules = '*.json'
+        self.assertFalse(datasource._ignore('file.txt'))
+        self.assertTrue(datasource._ignore('file.json'))
+
+    def test_walk(self):
+        datasource = DataSource(ignore_rules='*.txt')
+
+        with tempfile.TemporaryDirectory() as root:
+            for path in ('file1.json', 'file2.txt', '.hidden', 'dir1/file3.yaml', 'dir1/dir2/file4.json', '.git/HEAD'):
+                os.makedirs(os.path.join(root, os.path.dirname(path)), exist_ok=True)
+                with open(os.path.join(root, path), 'w') as f:
+                    f.write(path)
+
+            self.assertSetEqual(
+                datasource._walk(root),
+                {'file1.json', 'dir1/file3.yaml', 'dir1/dir2/file4.json'}
+            )
+
+    def test_sync(self):
+
+        with tempfile.TemporaryDirectory() as root:
+
+            def write_file(path, content, mtime):
+                file_path = os.path.join(root, path)
+                with open(file_path, 'w') as f:
+                    f.write(content)
+                os.utime(file_path, (mtime, mtime))
+
+            datasource = DataSource.objects.create(
+                name='Data Source 1',
+                type=DataSourceTypeChoices.LOCAL,
+                source_url=f'file://{root}'
+            )
+            write_file('file1.json', '{"a": 1}', 1000)
+            write_file('file2.json', '{"b": 2}', 1000)
+            write_file('file3.json', '{"c": 3}', 1000)
+
+            # Create new files
+            datasource.sync()
+            self.assertSetEqual(
+                set(datasource.datafiles.values_list('path', flat=True)),
+                {'file1.json', 'file2.json', 'file3.json'}
+            )
+            file1 = datasource.datafiles.get(path='file1.json')
+            self.assertEqual(bytes(file1.data), b'{"a": 1}')
+            self.assertEqual(file1.mtime, 1000)
+            file2 = datasource.datafiles.get(path='file2.json')
+
+            # Modify file1, touch file2 without changing its contents, delete file3, and create file4
+            write_file('file1.json', '{"a": 10}', 2000)
+            write_file('file2.json', '{"b": 2}', 2000)
+            os.remove(os.path.join(root, 'file3.json'))
+            write_file('file4.json', '{"d": 4}', 2000)
+            datasource.sync()
+            self.assertSetEqual(
+                set(datasource.datafiles.values_list('path', flat=True)),
+                {'file1.json', 'file2.json', 'file4.json'}
+            )
+            file1.refresh_from_db()
+            self.assertEqual(bytes(file1.data), b'{"a": 10}')
+            self.assertEqual(file1.mtime, 2000)
+            file2_last_updated = file2.last_updated
+            file2.refresh_from_db()
+            self.assertEqual(file2.mtime, 2000)
+            self.assertEqual(file2.last_updated, file2_last_updated)
+
+            # Files with an unchanged size & modification time are not read
+            write_file('file1.json', '{"a": 99}', 2000)
+            datasource.sync()
+            file1.refresh_from_db()
+            self.assertEqual(bytes(file1.data), b'{"a": 10}')
+
+            # A missing modification time is recorded without modifying the file
+            datasource.datafiles.update(mtime=None)
+            datasource.sync()
+            file2.refresh_from_db()
+            self.assertEqual(file2.mtime, 2000)
+            self.assertEqual(file2.last_updated, file2_last_updated)
+
+    def test_sync_non_persistent_backend(self):
+
+        with tempfile.TemporaryDirectory() as root:
+            for i in range(1, 4):
+                file_path = os.path.join(root, f'file{i}.json')
+                with open(file_path, 'w') as f:
+                    f.write(f'{{"key": {i}}}')
+                os.utime(file_path, (1000, 1000))
+
+            datasource = DataSource.objects.create(
+                name='Data Source 1',
+                type=DataSourceTypeChoices.LOCAL,
+                source_url=f'file://{root}'
+            )
+            datasource.sync()
+
+            # Change the modification time of every file without changing its contents
+            for i in range(1, 4):
+                os.utime(os.path.join(root, f'file{i}.json'), (2000, 2000))
+
+            # Modification times are not recorded for backends which fetch a fresh copy on every sync
+            with patch.object(LocalBackend, 'persistent', False), CaptureQueriesContext(connection) as context:
+                datasource.sync()
+            datafile_updates = [
+                query['sql'] for query in context.captured_queries
+                if query['sql'].startswith('UPDATE') and 'core_datafile' in query['sql']
+            ]
+            self.assertEqual(datafile_updates, [])
+            self.assertSetEqual(set(datasource.datafiles.values_list('mtime', flat=True)), {1000})
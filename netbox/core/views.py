@@ -109,7 +109,7 @@ class DataFileView(generic.ObjectView):
 
 @register_model_view(DataFile, 'delete')
 class DataFileDeleteView(generic.ObjectDeleteView):
-    queryset = DataFile.objects.all()
+    queryset = DataFile.objects.defer('data')
 
 
 class DataFileBulkDeleteView(generic.BulkDeleteView):
@@ -17,6 +17,7 @@ from utilities.filters import (
 )
 from virtualization.models import Cluster
 from wireless.choices import WirelessRoleChoices, WirelessChannelChoices
+from wireless.models import WirelessLAN
 from .choices import *
 from .constants import *
 from .models import *
@@ -1448,6 +1449,11 @@ class InterfaceFilterSet(
         to_field_name='identifier',
         label=_('L2VPN'),
     )
+    wireless_lan_id = django_filters.ModelMultipleChoiceFilter(
+        field_name='wireless_lans',
+        queryset=WirelessLAN.objects.all(),
+        label=_('Wireless LAN (ID)'),
+    )
 
     class Meta:
         model = Interface
@@ -10,6 +10,7 @@ from utilities.choices import ColorChoices
 from utilities.testing import ChangeLoggedFilterSetTests, create_test_device
 from virtualization.models import Cluster, ClusterType
 from wireless.choices import WirelessChannelChoices, WirelessRoleChoices
+from wireless.models import WirelessLAN
 
 
 class RegionTestCase(TestCase, ChangeLoggedFilterSetTests):
@@ -3071,6 +3072,19 @@ class InterfaceTestCase(TestCase, ChangeLoggedFilterSetTests):
         params = {'vdc_identifier': vdc.values_list('identifier', flat=True)}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 3)
 
+    def test_wireless_lan(self):
+        wireless_lans = (
+            WirelessLAN(ssid='WLAN1'),
+            WirelessLAN(ssid='WLAN2'),
+        )
+        WirelessLAN.objects.bulk_create(wireless_lans)
+        interfaces = list(self.queryset.all()[:3])
+        interfaces[0].wireless_lans.add(wireless_lans[0])
+        interfaces[1].wireless_lans.add(wireless_lans[1])
+        interfaces[2].wireless_lans.add(wireless_lans[1])
+        params = {'wireless_lan_id': [wireless_lans[0].pk, wireless_lans[1].pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 3)
+
 
 class FrontPortTestCase(TestCase, ChangeLoggedFilterSetTests):
     queryset = FrontPort.objects.all()
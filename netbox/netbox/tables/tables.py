@@ -3,6 +3,7 @@ from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet, TextField
 from django.db.models.fields.related import RelatedField
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
@@ -14,7 +15,7 @@ from extras.models import CustomField, CustomLink
 from extras.choices import CustomFieldVisibilityChoices
 from netbox.tables import columns
 from utilities.paginator import EnhancedPaginator, get_paginate_count
-from utilities.utils import get_viewname, highlight_string, title
+from utilities.utils import count_queryset, get_viewname, highlight_string, title
 
 __all__ = (
     'BaseTable',
@@ -23,6 +24,20 @@ __all__ = (
 )
 
 
+class NetBoxTableQuerysetData(TableQuerysetData):
+    """
+    Table data backed by a QuerySet, which counts annotated querysets efficiently.
+    """
+    def __init__(self, data):
+        super().__init__(data)
+        self._count = None
+
+    def __len__(self):
+        if self._count is None:
+            self._count = count_queryset(self.data)
+        return self._count
+
+
 class BaseTable(tables.Table):
     """
     Base table class for NetBox objects. Adds support for:
@@ -40,9 +55,13 @@ class BaseTable(tables.Table):
             'class': 'table table-hover object-list',
         }
 
-    def __init__(self, *args, user=None, **kwargs):
+    def __init__(self, data, *args, user=None, **kwargs):
+
+        # Wrap QuerySets so that the table (and thus its paginator) counts them efficiently
+        if isinstance(data, QuerySet):
+            data = NetBoxTableQuerysetData(data)
 
-        super().__init__(*args, **kwargs)
+        super().__init__(data, *args, **kwargs)
 
         # Set default empty_text if none was provided
         if self.empty_text is None:
@@ -106,6 +125,29 @@ class BaseTable(tables.Table):
                         prefetch_fields.append('__'.join(prefetch_path))
             self.data.data = self.data.data.prefetch_related(*prefetch_fields)
 
+    def _get_deferrable_fields(self):
+        """
+        Return the names of any TextFields on the model which are referenced only by hidden columns. These can be
+        omitted when retrieving table data. (Combined querysets do not support deferral.)
+        """
+        if not isinstance(self.data, TableQuerysetData) or self.data.data.query.combinator:
+            return set()
+        model = self.data.data.model
+        hidden_fields = set()
+        visible_fields = set()
+        for column in self.columns.iterall():
+            field_name = column.accessor.split(column.accessor.SEPARATOR)[0]
+            if column.visible:
+                visible_fields.add(field_name)
+                continue
+            try:
+                field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if isinstance(field, TextField):
+                hidden_fields.add(field_name)
+        return hidden_fields - visible_fields
+
     def _get_columns(self, visible=True):
         columns = []
         for name, column in self.columns.items():
@@ -148,6 +190,11 @@ class BaseTable(tables.Table):
                 # If no ordering has been specified, set the preferred ordering (if any).
                 self.order_by = ordering
 
+        # Defer loading of large text fields displayed only by hidden columns, unless exporting all columns
+        if request.GET.get('export', 'table') == 'table':
+            if defer_fields := self._get_deferrable_fields():
+                self.data.data = self.data.data.defer(*defer_fields)
+
         # Paginate the table results
         paginate = {
             'paginator_class': EnhancedPaginator,
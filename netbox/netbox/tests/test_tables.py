@@ -1,5 +1,6 @@
+from django.contrib.auth.models import AnonymousUser
 from django.template import Context, Template
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 
 from dcim.models import Site
 from netbox.tables import NetBoxTable, columns
@@ -35,3 +36,56 @@ class TagColumnTest(TestCase):
             'table': table
         })
         template.render(context)
+
+
+class CommentsTable(NetBoxTable):
+    comments = columns.MarkdownColumn()
+
+    class Meta(NetBoxTable.Meta):
+        model = Site
+        fields = ('pk', 'name', 'comments')
+        default_columns = ('pk', 'name')
+
+
+class DeferredFieldsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}', comments=f'Comments {i}') for i in range(1, 4)
+        ])
+
+    @staticmethod
+    def get_request(**params):
+        request = RequestFactory().get('/', params)
+        request.user = AnonymousUser()
+        return request
+
+    def test_hidden_column_deferred(self):
+        table = CommentsTable(Site.objects.all())
+        table.configure(self.get_request())
+
+        self.assertEqual(table.data.data.query.deferred_loading, ({'comments'}, True))
+
+    def test_visible_column_not_deferred(self):
+        table = CommentsTable(Site.objects.all())
+        table.columns.show('comments')
+        table.configure(self.get_request())
+
+        self.assertEqual(table.data.data.query.deferred_loading, (set(), True))
+
+    def test_export_all_not_deferred(self):
+        table = CommentsTable(Site.objects.all())
+        table.configure(self.get_request(export=''))
+        self.assertEqual(table.data.data.query.deferred_loading, (set(), True))
+
+        # Exporting only the visible columns may still defer hidden fields
+        table = CommentsTable(Site.objects.all())
+        table.configure(self.get_request(export='table'))
+        self.assertEqual(table.data.data.query.deferred_loading, ({'comments'}, True))
+
+    def test_combined_queryset_not_deferred(self):
+        table = CommentsTable(Site.objects.all())
+        table.data.data = Site.objects.filter(name='Site 1').union(Site.objects.filter(name='Site 2'))
+
+        self.assertSetEqual(table._get_deferrable_fields(), set())
@@ -313,13 +313,9 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
     def _save_object(self, model_form, request):
 
-        # Save the primary object
+        # Save the primary object. (Object-level permissions are enforced for all saved objects at once by post().)
         obj = self.save_object(model_form, request)
 
-        # Enforce object-level permissions
-        if not self.queryset.filter(pk=obj.pk).first():
-            raise PermissionsViolation()
-
         # Iterate through the related object forms (if any), validating and saving each instance.
         for field_name, related_object_form in self.related_object_forms.items():
 
@@ -506,6 +502,15 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
         nullified_fields = request.POST.getlist('_nullify')
         updated_objects = []
 
+        # Resolve the model field (if any) for each standard form field once, rather than for every object
+        model_fields = {}
+        for name in standard_fields:
+            try:
+                model_fields[name] = self.queryset.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                # This form field is used to modify a field rather than set its value directly
+                model_fields[name] = None
+
         for obj in self.queryset.filter(pk__in=form.cleaned_data['pk']):
 
             # Take a snapshot of change-logged models
@@ -513,13 +518,7 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
                 obj.snapshot()
 
             # Update standard fields. If a field is listed in _nullify, delete its value.
-            for name in standard_fields:
-
-                try:
-                    model_field = self.queryset.model._meta.get_field(name)
-                except FieldDoesNotExist:
-                    # This form field is used to modify a field rather than set its value directly
-                    model_field = None
+            for name, model_field in model_fields.items():
 
                 # Handle nullification
                 if name in form.nullable_fields and name in nullified_fields:
@@ -780,8 +779,9 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
                 logger.debug("Form validation was successful")
 
                 # Delete objects
-                queryset = self.queryset.filter(pk__in=pk_list)
-                deleted_count = queryset.count()
+                # Evaluate the queryset once; its length gives the deleted count without a separate COUNT query
+                queryset = list(self.queryset.filter(pk__in=pk_list))
+                deleted_count = len(queryset)
                 try:
                     for obj in queryset:
                         # Take a snapshot of change-logged models
@@ -1,6 +1,9 @@
 from django.core.paginator import Paginator, Page
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 
 from netbox.config import get_config
+from utilities.utils import count_queryset
 
 
 class EnhancedPaginator(Paginator):
@@ -26,6 +29,15 @@ class EnhancedPaginator(Paginator):
 
         super().__init__(object_list, per_page, orphans=orphans, **kwargs)
 
+    @cached_property
+    def count(self):
+        """
+        Return the total number of objects. (Table data is counted by the table itself.)
+        """
+        if isinstance(self.object_list, QuerySet):
+            return count_queryset(self.object_list)
+        return super().count
+
     def _get_page(self, *args, **kwargs):
         return EnhancedPage(*args, **kwargs)
 
@@ -0,0 +1,38 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from dcim.models import Device, Site
+from dcim.tables import SiteTable
+from utilities.paginator import EnhancedPaginator
+from utilities.utils import count_related
+
+
+class EnhancedPaginatorTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create(
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)
+        )
+
+    def test_count_annotated_queryset(self):
+        queryset = Site.objects.annotate(device_count=count_related(Device, 'site'))
+        table = SiteTable(queryset)
+
+        with CaptureQueriesContext(connection) as context:
+            table.paginate(paginator_class=EnhancedPaginator, per_page=25)
+            self.assertEqual(table.paginator.count, 3)
+            self.assertEqual(len(table.rows), 3)
+
+        # A single COUNT query should be issued, without evaluating the annotation
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIn('COUNT', context.captured_queries[0]['sql'])
+        self.assertNotIn(Device._meta.db_table, context.captured_queries[0]['sql'])
+
+    def test_count_queryset(self):
+        paginator = EnhancedPaginator(Site.objects.all(), 25)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, 3)
+            self.assertEqual(paginator.num_pages, 1)
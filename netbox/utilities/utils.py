@@ -139,6 +139,17 @@ def count_related(model, field):
     return Coalesce(subquery, 0)
 
 
+def count_queryset(queryset):
+    """
+    Return the number of objects in a QuerySet. Annotated querysets are counted on their primary keys alone, to avoid
+    evaluating annotations (e.g. related object counts) within the COUNT subquery for every row.
+    """
+    query = queryset.query
+    if query.annotations and not query.combinator and not query.distinct_fields:
+        queryset = queryset.values('pk')
+    return queryset.count()
+
+
 def serialize_object(obj, resolve_tags=True, extra=None):
     """
     Return a generic JSON representation of an object using Django's built-in serializer. (This is used for things like
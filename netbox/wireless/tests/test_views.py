@@ -1,3 +1,6 @@
+from django.test import override_settings
+from django.urls import reverse
+
 from wireless.choices import *
 from wireless.models import *
 from dcim.choices import InterfaceTypeChoices, LinkStatusChoices
@@ -120,6 +123,33 @@ class WirelessLANTestCase(ViewTestCases.PrimaryObjectViewTestCase):
             'description': 'New description',
         }
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_wirelesslan_interfaces(self):
+        wireless_lan = WirelessLAN.objects.first()
+        device = create_test_device('test-device')
+        interfaces = (
+            Interface(device=device, name='radio0', type=InterfaceTypeChoices.TYPE_80211AC),
+            Interface(device=device, name='radio1', type=InterfaceTypeChoices.TYPE_80211AC),
+            Interface(device=device, name='radio2', type=InterfaceTypeChoices.TYPE_80211AC),
+        )
+        Interface.objects.bulk_create(interfaces)
+        interfaces[0].wireless_lans.add(wireless_lan)
+        interfaces[1].wireless_lans.add(wireless_lan)
+
+        # Attached interfaces are embedded in the WirelessLAN view from the filtered interface list
+        url = f"{reverse('dcim:interface_list')}?wireless_lan_id={wireless_lan.pk}"
+        response = self.client.get(
+            url,
+            HTTP_HX_REQUEST='true',
+            HTTP_HX_CURRENT_URL=f'http://testserver{wireless_lan.get_absolute_url()}'
+        )
+        self.assertHttpStatus(response, 200)
+        content = str(response.content)
+        self.assertIn('radio0', content)
+        self.assertIn('radio1', content)
+        self.assertNotIn('radio2', content)
+        self.assertNotIn('hx-push-url', content)
+
 
 class WirelessLinkTestCase(ViewTestCases.PrimaryObjectViewTestCase):
     model = WirelessLink
@@ -10,14 +10,21 @@ from .models import *
 # Wireless LAN groups
 #
 
-class WirelessLANGroupListView(generic.ObjectListView):
-    queryset = WirelessLANGroup.objects.add_related_count(
+def _wirelesslangroup_queryset():
+    """
+    Return WirelessLANGroups annotated with the cumulative count of WirelessLANs assigned to each group.
+    """
+    return WirelessLANGroup.objects.add_related_count(
         WirelessLANGroup.objects.all(),
         WirelessLAN,
         'group',
         'wirelesslan_count',
         cumulative=True
-    ).prefetch_related('tags')
+    )
+
+
+class WirelessLANGroupListView(generic.ObjectListView):
+    queryset = _wirelesslangroup_queryset().prefetch_related('tags')
     filterset = filtersets.WirelessLANGroupFilterSet
     filterset_form = forms.WirelessLANGroupFilterForm
     table = tables.WirelessLANGroupTable
@@ -25,12 +32,17 @@ class WirelessLANGroupListView(generic.ObjectListView):
 
 @register_model_view(WirelessLANGroup)
 class WirelessLANGroupView(generic.ObjectView):
-    queryset = WirelessLANGroup.objects.all()
+    queryset = WirelessLANGroup.objects.select_related('parent').prefetch_related('tags')
 
     def get_extra_context(self, request, instance):
-        groups = instance.get_descendants(include_self=True)
+        # Match WirelessLANs assigned to this group or any of its descendants by the group's MPTT range
+        wireless_lans = WirelessLAN.objects.restrict(request.user, 'view').filter(
+            group__tree_id=instance.tree_id,
+            group__lft__gte=instance.lft,
+            group__rght__lte=instance.rght
+        )
         related_models = (
-            (WirelessLAN.objects.restrict(request.user, 'view').filter(group__in=groups), 'group_id'),
+            (wireless_lans, 'group_id'),
         )
 
         return {
@@ -56,26 +68,14 @@ class WirelessLANGroupBulkImportView(generic.BulkImportView):
 
 
 class WirelessLANGroupBulkEditView(generic.BulkEditView):
-    queryset = WirelessLANGroup.objects.add_related_count(
-        WirelessLANGroup.objects.all(),
-        WirelessLAN,
-        'group',
-        'wirelesslan_count',
-        cumulative=True
-    )
+    queryset = _wirelesslangroup_queryset()
     filterset = filtersets.WirelessLANGroupFilterSet
     table = tables.WirelessLANGroupTable
     form = forms.WirelessLANGroupBulkEditForm
 
 
 class WirelessLANGroupBulkDeleteView(generic.BulkDeleteView):
-    queryset = WirelessLANGroup.objects.add_related_count(
-        WirelessLANGroup.objects.all(),
-        WirelessLAN,
-        'group',
-        'wirelesslan_count',
-        cumulative=True
-    )
+    queryset = _wirelesslangroup_queryset()
     filterset = filtersets.WirelessLANGroupFilterSet
     table = tables.WirelessLANGroupTable
 
@@ -86,7 +86,7 @@ class WirelessLANGroupBulkDeleteView(generic.BulkDeleteView):
 
 class WirelessLANListView(generic.ObjectListView):
     queryset = WirelessLAN.objects.annotate(
-        interface_count=count_related(Interface, 'wireless_lans')
+        interface_count=count_related(Interface.wireless_lans.through, 'wirelesslan')
     )
     filterset = filtersets.WirelessLANFilterSet
     filterset_form = forms.WirelessLANFilterForm
@@ -95,18 +95,7 @@ class WirelessLANListView(generic.ObjectListView):
 
 @register_model_view(WirelessLAN)
 class WirelessLANView(generic.ObjectView):
-    queryset = WirelessLAN.objects.all()
-
-    def get_extra_context(self, request, instance):
-        attached_interfaces = Interface.objects.restrict(request.user, 'view').filter(
-            wireless_lans=instance
-        )
-        interfaces_table = tables.WirelessLANInterfacesTable(attached_interfaces, user=request.user)
-        interfaces_table.configure(request)
-
-        return {
-            'interfaces_table': interfaces_table,
-        }
+    queryset = WirelessLAN.objects.select_related('group', 'vlan', 'tenant__group').prefetch_related('tags')
 
 
 @register_model_view(WirelessLAN, 'edit')
@@ -152,7 +141,9 @@ class WirelessLinkListView(generic.ObjectListView):
 
 @register_model_view(WirelessLink)
 class WirelessLinkView(generic.ObjectView):
-    queryset = WirelessLink.objects.all()
+    queryset = WirelessLink.objects.select_related(
+        'interface_a__device', 'interface_b__device', 'tenant__group'
+    ).prefetch_related('tags')
 
 
 @register_model_view(WirelessLink, 'edit')